@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Tests for the task file snapshot and change log persistence.
+Run with: python -m unittest test_todo_app
+"""
+
+import contextlib
+import gc
+import io
+import json
+import os
+import tempfile
+import unittest
+import weakref
+from unittest import mock
+
+import todo_app
+from todo_app import TodoApp
+
+
+class PersistenceTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "tasks.json")
+        self.log_filename = f"{self.filename}.log"
+        todo_app._TASKS_CACHE.clear()
+        # The app reports every operation on stdout; keep test output quiet
+        self._quiet = contextlib.redirect_stdout(io.StringIO())
+        self._quiet.__enter__()
+    
+    def tearDown(self):
+        self._quiet.__exit__(None, None, None)
+        todo_app._TASKS_CACHE.clear()
+        self.tmpdir.cleanup()
+    
+    def reload(self) -> TodoApp:
+        """Construct a fresh app from disk, bypassing the in-process parse cache."""
+        todo_app._TASKS_CACHE.clear()
+        return TodoApp(self.filename)
+    
+    def titles(self, app: TodoApp):
+        return [task.title for task in app.tasks]
+    
+    def test_log_replay_restores_all_operations(self):
+        app = TodoApp(self.filename)
+        app.add_task("one")
+        app.add_task("two", "second")
+        app.add_task("three")
+        app.complete_task(2)
+        app.update_task(3, "third", None)
+        app.find_task_by_id(1)  # lookups must not be logged
+        
+        app2 = self.reload()
+        self.assertTrue(os.path.exists(self.log_filename))
+        self.assertEqual(self.titles(app2), ["one", "two", "third"])
+        self.assertTrue(app2.find_task_by_id(2).completed)
+        self.assertEqual(app2.next_id, 4)
+        self.assertEqual(app2.get_task_stats(), {'total': 3, 'completed': 1, 'pending': 2})
+    
+    def test_truncated_log_line_does_not_swallow_later_events(self):
+        # The stdlib parser raises UnicodeDecodeError rather than JSONDecodeError
+        # on a cut multibyte character, so exercise the fallback loader as well
+        for name, loads in (("default", todo_app._loads), ("stdlib", json.loads)):
+            with self.subTest(loader=name), mock.patch.object(todo_app, '_loads', loads):
+                self.filename = os.path.join(self.tmpdir.name, f"{name}.json")
+                self.log_filename = f"{self.filename}.log"
+                self.check_truncated_log_recovery()
+    
+    def check_truncated_log_recovery(self):
+        app = TodoApp(self.filename)
+        app.add_task("café ☕")
+        app.add_task("naïve 😀")
+        # Simulate a crash in the middle of appending the second event,
+        # cutting the emoji's UTF-8 encoding in half
+        with open(self.log_filename, 'rb') as file:
+            cut = file.read().rindex("😀".encode('utf-8')) + 2
+        with open(self.log_filename, 'rb+') as file:
+            file.truncate(cut)
+        
+        app2 = self.reload()
+        self.assertEqual(self.titles(app2), ["café ☕"])
+        app2.add_task("three-after-crash")
+        
+        app3 = self.reload()
+        self.assertEqual(self.titles(app3), ["café ☕", "three-after-crash"])
+        self.assertEqual([task.id for task in app3.tasks], [1, 2])
+        self.assertEqual(app3.next_id, 3)
+    
+    def test_corrupt_snapshot_is_set_aside_and_log_replayed(self):
+        app = TodoApp(self.filename)
+        app.add_task("logged")
+        with open(self.filename, 'w', encoding='utf-8') as file:
+            file.write("{broken")
+        
+        app2 = self.reload()
+        self.assertEqual(self.titles(app2), ["logged"])
+        self.assertTrue(os.path.exists(f"{self.filename}.corrupt"))
+        with open(self.filename, 'rb') as file:
+            self.assertEqual(len(json.loads(file.read())['tasks']), 1)
+        
+        app2.add_task("after")
+        app3 = self.reload()
+        self.assertEqual(self.titles(app3), ["logged", "after"])
+        self.assertEqual([task.id for task in app3.tasks], [1, 2])
+
+    
+    def test_snapshot_from_cached_fragments_matches_tasks(self):
+        app = TodoApp(self.filename)
+        with app.batch():
+            for i in range(5):
+                app.add_task(f"task {i}", "with \"quotes\" and ünïcode")
+        app.save_tasks()
+        app.complete_task(2)
+        app.update_task(3, "renamed", None)
+        with mock.patch('builtins.input', return_value='y'):
+            app.delete_task(4)
+        app.save_tasks()
+        
+        with open(self.filename, 'rb') as file:
+            on_disk = json.loads(file.read())
+        self.assertEqual(on_disk, {'next_id': app.next_id, 'tasks': [task.to_dict() for task in app.tasks]})
+        self.assertEqual([task.to_dict() for task in self.reload().tasks], on_disk['tasks'])
+    
+    def test_iso_timestamps_are_migrated_on_disk_once(self):
+        legacy = {'next_id': 2, 'tasks': [{
+            'id': 1, 'title': "old", 'description': "", 'completed': True,
+            'created_at': "2025-07-01T21:05:32.531721", 'completed_at': "2025-07-02T08:00:00",
+        }]}
+        with open(self.filename, 'w', encoding='utf-8') as file:
+            json.dump(legacy, file)
+        
+        app = TodoApp(self.filename)
+        self.assertIsInstance(app.tasks[0].created_at, int)
+        with open(self.filename, 'rb') as file:
+            task = json.loads(file.read())['tasks'][0]
+        self.assertIsInstance(task['created_at'], int)
+        self.assertIsInstance(task['completed_at'], int)
+    
+    def test_bare_list_file_is_upgraded_on_load(self):
+        legacy = [
+            {'id': 1, 'title': "a", 'description': "", 'completed': False,
+             'created_at': 1751365800, 'completed_at': None},
+            {'id': 4, 'title': "b", 'description': "", 'completed': False,
+             'created_at': 1751365800, 'completed_at': None},
+        ]
+        with open(self.filename, 'w', encoding='utf-8') as file:
+            json.dump(legacy, file)
+        
+        app = TodoApp(self.filename)
+        self.assertEqual(app.next_id, 5)
+        with open(self.filename, 'rb') as file:
+            self.assertEqual(json.loads(file.read())['next_id'], 5)
+    
+    def test_snapshot_without_next_id_key_loads(self):
+        with open(self.filename, 'w', encoding='utf-8') as file:
+            json.dump({'tasks': []}, file)
+        self.assertEqual(TodoApp(self.filename).next_id, 1)
+    
+    def test_nested_batches_flush_once_at_the_outermost_exit(self):
+        app = TodoApp(self.filename)
+        with app.batch():
+            with app.batch():
+                app.add_task("inner")
+            self.assertFalse(os.path.exists(self.log_filename))
+            app.add_task("outer")
+        self.assertEqual(self.titles(self.reload()), ["inner", "outer"])
+    
+    def test_app_is_not_kept_alive_by_exit_hook(self):
+        app = TodoApp(self.filename)
+        ref = weakref.ref(app)
+        del app
+        gc.collect()
+        self.assertIsNone(ref())
+
+if __name__ == "__main__":
+    unittest.main()
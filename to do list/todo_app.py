@@ -4,68 +4,320 @@ To-Do List CLI Application
 A command-line interface for managing tasks with persistent storage.
 """
 
+import atexit
+import functools
 import json
 import os
+import sys
+import time
+import weakref
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from itertools import chain, product
+from typing import Callable, List, Dict, Iterator, Optional, Tuple
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    _dumps = orjson.dumps
+
+    def _dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is optional; fall back to the standard library
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def _dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+_IO_BUFFER_SIZE = 1 << 16
+
+# The change log is folded into the snapshot once it outgrows this or the snapshot
+_COMPACT_MIN_LOG_SIZE = 1 << 16
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_ts(timestamp: int) -> str:
+    """Format an epoch timestamp for display."""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
+
+def _to_epoch(timestamp):
+    """Convert a legacy ISO timestamp string to epoch seconds."""
+    if isinstance(timestamp, str):
+        return int(datetime.fromisoformat(timestamp).timestamp())
+    return timestamp
+
+
+def _build_task_templates() -> Dict[Tuple[bool, bool, bool], str]:
+    """Prebuild a display template for every (completed, description, completed_at) shape."""
+    templates = {}
+    for completed, has_description, has_completed_at in product((False, True), repeat=3):
+        lines = [("\n✅" if completed else "\n⏳") + " ID: {id} | {title}"]
+        if has_description:
+            lines.append("   📄 Description: {description}")
+        lines.append("   📅 Created: {created}")
+        if completed and has_completed_at:
+            lines.append("   ✅ Completed: {completed}")
+        templates[completed, has_description, has_completed_at] = "\n".join(lines)
+    return templates
+
+_TASK_TEMPLATES = _build_task_templates()
+
+
+class Task:
+    """A single to-do item with fixed fields and dict-style field access."""
+    __slots__ = ('id', 'title', 'description', 'completed', 'created_at', 'completed_at')
+    
+    def __init__(self, task_id: int, title: str, description: str = "", completed: bool = False,
+                 created_at: Optional[int] = None, completed_at: Optional[int] = None):
+        self.id = task_id
+        self.title = title
+        self.description = description
+        self.completed = completed
+        self.created_at = created_at
+        self.completed_at = completed_at
+    
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __setitem__(self, key: str, value) -> None:
+        setattr(self, key, value)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Task":
+        """Build a task from its JSON representation."""
+        return cls(data['id'], data['title'], data['description'], data['completed'],
+                   data['created_at'], data['completed_at'])
+    
+    def to_dict(self) -> Dict:
+        """Return the JSON representation of the task."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+# Parsed snapshots keyed by filename, validated against (mtime_ns, size)
+_TASKS_CACHE: Dict[str, Tuple[int, int, Dict]] = {}
+
+# Apps with possibly unsaved changes; weak so instances can still be garbage collected
+_LIVE_APPS: "weakref.WeakSet[TodoApp]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_apps() -> None:
+    """Save pending changes of every app still alive at interpreter exit."""
+    for app in list(_LIVE_APPS):
+        app.flush()
 
 class TodoApp:
     def __init__(self, filename: str = "tasks.json"):
         """Initialize the TodoApp with a filename for persistent storage."""
         self.filename = filename
-        self.tasks = self.load_tasks()
-        self.next_id = self._get_next_id()
+        self.log_filename = f"{filename}.log"
+        self._pending_events: List[Dict] = []
+        # Serialized JSON of each task keyed by task ID, dropped when the task changes
+        self._frag_cache: Dict[int, bytes] = {}
+        self._needs_snapshot = False
+        self.tasks, self.next_id = self.load_tasks()
+        self._by_id = {task['id']: task for task in self.tasks}
+        self._reindex()
+        if self._needs_snapshot:
+            # Rewrite damaged files before anything is appended to the log
+            self.save_tasks()
+        self._batch_depth = 0
+        _LIVE_APPS.add(self)
     
-    def _get_next_id(self) -> int:
-        """Get the next available task ID."""
-        if not self.tasks:
-            return 1
-        return max(task['id'] for task in self.tasks) + 1
+    def _reindex(self) -> None:
+        """Rebuild the ID-to-position index and the completed-flag column."""
+        self._index = {task['id']: i for i, task in enumerate(self.tasks)}
+        self._done = bytearray(task['completed'] for task in self.tasks)
     
-    def load_tasks(self) -> List[Dict]:
-        """Load tasks from JSON file."""
+    def load_tasks(self) -> Tuple[List[Task], int]:
+        """Load the task snapshot from JSON file and replay the change log on top.
+        
+        Returns the tasks and the next available task ID. Sets _needs_snapshot
+        when the files on disk are damaged or outdated and should be rewritten.
+        """
+        snapshot = {'next_id': None, 'tasks': []}
         try:
             if os.path.exists(self.filename):
-                with open(self.filename, 'r', encoding='utf-8') as file:
-                    return json.load(file)
-            return []
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+                st = os.stat(self.filename)
+                cached = _TASKS_CACHE.get(self.filename)
+                if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+                    snapshot = cached[2]
+                else:
+                    with open(self.filename, 'rb', buffering=_IO_BUFFER_SIZE) as file:
+                        snapshot = _loads(file.read())
+                    if isinstance(snapshot, list):
+                        # Older files hold a bare task list without next_id
+                        snapshot = {'next_id': None, 'tasks': snapshot}
+                    _TASKS_CACHE[self.filename] = (st.st_mtime_ns, st.st_size, snapshot)
+        except ValueError as e:  # JSONDecodeError, or UnicodeDecodeError from the stdlib parser
             print(f"Error loading tasks: {e}")
-            return []
+            # Keep the unreadable file for inspection and start from an empty snapshot
+            corrupt_filename = f"{self.filename}.corrupt"
+            try:
+                os.replace(self.filename, corrupt_filename)
+                print(f"⚠️ Unreadable task file moved to {corrupt_filename}")
+            except OSError as move_error:
+                print(f"Error moving unreadable task file: {move_error}")
+            self._needs_snapshot = True
+        except FileNotFoundError as e:
+            print(f"Error loading tasks: {e}")
+        
+        tasks = [Task.from_dict(task) for task in snapshot.get('tasks', [])]
+        next_id = snapshot.get('next_id')
+        if next_id is None:
+            next_id = max((task.id for task in tasks), default=0) + 1
+            if os.path.exists(self.filename):
+                # Upgrade a legacy file so the scan above is not repeated on every start
+                self._needs_snapshot = True
+        tasks, next_id = self._replay_log(tasks, next_id)
+        # Migrate tasks saved with ISO timestamp strings, persisting the result once
+        for task in tasks:
+            if isinstance(task.created_at, str) or isinstance(task.completed_at, str):
+                task.created_at = _to_epoch(task.created_at)
+                task.completed_at = _to_epoch(task.completed_at)
+                self._needs_snapshot = True
+        return tasks, next_id
+
+    def _replay_log(self, tasks: List[Task], next_id: int) -> Tuple[List[Task], int]:
+        """Apply the events recorded in the change log to a task snapshot."""
+        if not os.path.exists(self.log_filename):
+            return tasks, next_id
+        by_id = {task['id']: task for task in tasks}
+        with open(self.log_filename, 'rb', buffering=_IO_BUFFER_SIZE) as file:
+            for line in file:
+                if not line.endswith(b'\n'):
+                    # An unterminated last line means a crash mid-append; compact so
+                    # the next append does not run into it
+                    self._needs_snapshot = True
+                try:
+                    event = _loads(line)
+                except ValueError:  # Also UnicodeDecodeError for a cut multibyte character
+                    self._needs_snapshot = True
+                    continue  # Skip a partially written line left by a crash
+                op = event['op']
+                if op == 'add':
+                    task = Task.from_dict(event['task'])
+                    by_id[task.id] = task
+                    next_id = max(next_id, task.id + 1)
+                elif op == 'update' and event['id'] in by_id:
+                    task = by_id[event['id']]
+                    for key, value in event['fields'].items():
+                        task[key] = value
+                elif op == 'delete':
+                    by_id.pop(event['id'], None)
+        return list(by_id.values()), next_id
     
     def save_tasks(self) -> bool:
-        """Save tasks to JSON file."""
+        """Write a full snapshot of tasks atomically and clear the change log."""
+        tmp_filename = f"{self.filename}.tmp"
         try:
-            with open(self.filename, 'w', encoding='utf-8') as file:
-                json.dump(self.tasks, file, indent=2, ensure_ascii=False)
+            parts = []
+            for task in self.tasks:
+                fragment = self._frag_cache.get(task.id)
+                if fragment is None:
+                    fragment = self._frag_cache[task.id] = _dumps(task.to_dict())
+                parts.append(fragment)
+            with open(tmp_filename, 'wb', buffering=_IO_BUFFER_SIZE) as file:
+                file.write(b'{"next_id":%d,"tasks":[%s]}' % (self.next_id, b','.join(parts)))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_filename, self.filename)
+            if os.path.exists(self.log_filename):
+                os.remove(self.log_filename)
+            self._pending_events.clear()
+            # Rebuilding every task dict here would cost as much as the cached
+            # fragments save, so let the next load re-parse the snapshot instead
+            _TASKS_CACHE.pop(self.filename, None)
             return True
         except Exception as e:
             print(f"Error saving tasks: {e}")
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
+            return False
+    
+    def export_pretty(self, path: str) -> bool:
+        """Export tasks to an indented, human-readable JSON file."""
+        try:
+            data = {'next_id': self.next_id, 'tasks': [task.to_dict() for task in self.tasks]}
+            with open(path, 'wb', buffering=_IO_BUFFER_SIZE) as file:
+                file.write(_dumps_pretty(data))
+            return True
+        except Exception as e:
+            print(f"Error exporting tasks: {e}")
             return False
     
+    def _maybe_save(self, event: Dict) -> bool:
+        """Record a change event and persist it unless a batch is in progress."""
+        self._frag_cache.pop(event.get('id'), None)
+        self._pending_events.append(event)
+        if self._batch_depth:
+            return True
+        return self.flush()
+
+    def flush(self) -> bool:
+        """Append unsaved change events to the log, compacting it when it grows large."""
+        if not self._pending_events:
+            return True
+        try:
+            with open(self.log_filename, 'ab', buffering=_IO_BUFFER_SIZE) as file:
+                file.write(b''.join(_dumps(event) + b'\n' for event in self._pending_events))
+                file.flush()
+                os.fsync(file.fileno())
+                log_size = file.tell()
+        except OSError as e:
+            print(f"Error saving tasks: {e}")
+            return False
+        self._pending_events.clear()
+        
+        snapshot_size = os.path.getsize(self.filename) if os.path.exists(self.filename) else 0
+        if log_size > max(_COMPACT_MIN_LOG_SIZE, snapshot_size):
+            self.save_tasks()
+        return True
+
+    @contextmanager
+    def batch(self) -> Iterator["TodoApp"]:
+        """Defer saving until the end of a block of operations; blocks may nest."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
     def add_task(self, title: str, description: str = "") -> bool:
         """Add a new task to the list."""
         if not title.strip():
             print("Error: Task title cannot be empty!")
             return False
         
-        task = {
-            'id': self.next_id,
-            'title': title.strip(),
-            'description': description.strip(),
-            'completed': False,
-            'created_at': datetime.now().isoformat(),
-            'completed_at': None
-        }
+        task = Task(self.next_id, title.strip(), description.strip(), created_at=int(time.time()))
         
         self.tasks.append(task)
+        self._by_id[task.id] = task
+        self._index[task.id] = len(self.tasks) - 1
+        self._done.append(0)
         self.next_id += 1
         
-        if self.save_tasks():
-            print(f"✅ Task '{title}' added successfully! (ID: {task['id']})")
+        if self._maybe_save({'op': 'add', 'task': task.to_dict()}):
+            print(f"✅ Task '{title}' added successfully! (ID: {task.id})")
             return True
         else:
             self.tasks.pop()  # Remove the task if save failed
+            self._pending_events.pop()
+            del self._by_id[task.id]
+            del self._index[task.id]
+            self._done.pop()
             self.next_id -= 1
             return False
     
@@ -76,33 +328,30 @@ class TodoApp:
             return
         
         # Filter tasks based on completion status
-        filtered_tasks = self.tasks if show_completed else [t for t in self.tasks if not t['completed']]
+        filtered_tasks = iter(self.tasks) if show_completed else self._iter_flagged(0)
         
-        if not filtered_tasks:
+        first = next(filtered_tasks, None)
+        if first is None:
             status = "completed" if not show_completed else "pending"
             print(f"📝 No {status} tasks found!")
             return
+        filtered_tasks = chain((first,), filtered_tasks)
         
-        print("\n" + "="*60)
-        print("📋 YOUR TO-DO LIST")
-        print("="*60)
+        # Collect output lines and write them in one call
+        out = ["\n" + "="*60, "📋 YOUR TO-DO LIST", "="*60]
         
         for task in filtered_tasks:
-            status_icon = "✅" if task['completed'] else "⏳"
-            print(f"\n{status_icon} ID: {task['id']} | {task['title']}")
-            
-            if task['description']:
-                print(f"   📄 Description: {task['description']}")
-            
-            # Format and display dates
-            created_date = datetime.fromisoformat(task['created_at']).strftime("%Y-%m-%d %H:%M")
-            print(f"   📅 Created: {created_date}")
-            
-            if task['completed'] and task['completed_at']:
-                completed_date = datetime.fromisoformat(task['completed_at']).strftime("%Y-%m-%d %H:%M")
-                print(f"   ✅ Completed: {completed_date}")
+            template = _TASK_TEMPLATES[task.completed, bool(task.description), bool(task.completed_at)]
+            out.append(template.format(
+                id=task.id,
+                title=task.title,
+                description=task.description,
+                created=_fmt_ts(task.created_at),
+                completed=_fmt_ts(task.completed_at) if task.completed_at else None,
+            ))
         
-        print("\n" + "="*60)
+        out.append("\n" + "="*60)
+        sys.stdout.write("\n".join(out) + "\n")
     
     def update_task(self, task_id: int, title: str = None, description: str = None) -> bool:
         """Update an existing task's title or description."""
@@ -111,17 +360,26 @@ class TodoApp:
             print(f"❌ Task with ID {task_id} not found!")
             return False
         
-        # Update fields if provided
+        # Collect only the fields that actually change
+        fields = {}
         if title is not None:
             if not title.strip():
                 print("Error: Task title cannot be empty!")
                 return False
-            task['title'] = title.strip()
+            if title.strip() != task['title']:
+                fields['title'] = title.strip()
+        
+        if description is not None and description.strip() != task['description']:
+            fields['description'] = description.strip()
+        
+        if not fields:
+            print(f"ℹ️ Task {task_id} is unchanged.")
+            return True
         
-        if description is not None:
-            task['description'] = description.strip()
+        for key, value in fields.items():
+            task[key] = value
         
-        if self.save_tasks():
+        if self._maybe_save({'op': 'update', 'id': task_id, 'fields': fields}):
             print(f"✅ Task {task_id} updated successfully!")
             return True
         return False
@@ -139,9 +397,15 @@ class TodoApp:
             print("❌ Task deletion cancelled.")
             return False
         
-        self.tasks = [t for t in self.tasks if t['id'] != task_id]
+        del self._by_id[task_id]
+        idx = self._index.pop(task_id)
+        del self.tasks[idx]
+        del self._done[idx]
+        # Shift the positions of the tasks that followed the deleted one
+        for i in range(idx, len(self.tasks)):
+            self._index[self.tasks[i].id] = i
         
-        if self.save_tasks():
+        if self._maybe_save({'op': 'delete', 'id': task_id}):
             print(f"🗑️ Task '{task['title']}' deleted successfully!")
             return True
         return False
@@ -158,9 +422,11 @@ class TodoApp:
             return True
         
         task['completed'] = True
-        task['completed_at'] = datetime.now().isoformat()
+        self._done[self._index[task_id]] = 1
+        task['completed_at'] = int(time.time())
         
-        if self.save_tasks():
+        if self._maybe_save({'op': 'update', 'id': task_id,
+                             'fields': {'completed': True, 'completed_at': task['completed_at']}}):
             print(f"🎉 Task '{task['title']}' marked as completed!")
             return True
         return False
@@ -177,42 +443,57 @@ class TodoApp:
             return True
         
         task['completed'] = False
+        self._done[self._index[task_id]] = 0
         task['completed_at'] = None
         
-        if self.save_tasks():
+        if self._maybe_save({'op': 'update', 'id': task_id,
+                             'fields': {'completed': False, 'completed_at': None}}):
             print(f"🔄 Task '{task['title']}' marked as pending!")
             return True
         return False
     
-    def find_task_by_id(self, task_id: int) -> Optional[Dict]:
+    def find_task_by_id(self, task_id: int) -> Optional[Task]:
         """Find and return a task by its ID."""
-        for task in self.tasks:
-            if task['id'] == task_id:
-                return task
-        return None
+        return self._by_id.get(task_id)
+    
+    def get_completed_tasks(self) -> List[Task]:
+        """Return completed tasks in list order."""
+        return list(self._iter_flagged(1))
+    
+    def _iter_flagged(self, flag: int) -> Iterator[Task]:
+        """Yield tasks whose completed flag equals flag, scanning the _done column."""
+        done = self._done
+        i = done.find(flag)
+        while i != -1:
+            yield self.tasks[i]
+            i = done.find(flag, i + 1)
     
     def get_task_stats(self) -> Dict[str, int]:
         """Get statistics about tasks."""
         total = len(self.tasks)
-        completed = sum(1 for task in self.tasks if task['completed'])
+        completed = self._done.count(1)
         pending = total - completed
         return {'total': total, 'completed': completed, 'pending': pending}
 
+_MENU = "\n".join([
+    "\n" + "="*50,
+    "🚀 TO-DO LIST MANAGER",
+    "="*50,
+    "1. ➕ Add Task",
+    "2. 📋 View All Tasks",
+    "3. 👀 View Pending Tasks",
+    "4. ✏️  Update Task",
+    "5. ✅ Complete Task",
+    "6. 🔄 Uncomplete Task",
+    "7. 🗑️  Delete Task",
+    "8. 📊 View Statistics",
+    "9. ❌ Exit",
+    "="*50,
+]) + "\n"
+
 def display_menu():
     """Display the main menu options."""
-    print("\n" + "="*50)
-    print("🚀 TO-DO LIST MANAGER")
-    print("="*50)
-    print("1. ➕ Add Task")
-    print("2. 📋 View All Tasks")
-    print("3. 👀 View Pending Tasks")
-    print("4. ✏️  Update Task")
-    print("5. ✅ Complete Task")
-    print("6. 🔄 Uncomplete Task")
-    print("7. 🗑️  Delete Task")
-    print("8. 📊 View Statistics")
-    print("9. ❌ Exit")
-    print("="*50)
+    sys.stdout.write(_MENU)
 
 def get_user_input(prompt: str, input_type: type = str, allow_empty: bool = False):
     """Get user input with error handling."""
@@ -235,6 +516,89 @@ def get_user_input(prompt: str, input_type: type = str, allow_empty: bool = Fals
             print("\n👋 Goodbye!")
             exit(0)
 
+def handle_add(app: TodoApp) -> None:
+    """Prompt for and add a new task."""
+    print("\n➕ ADD NEW TASK")
+    title = get_user_input("Enter task title: ")
+    if title:
+        description = get_user_input("Enter task description (optional): ", allow_empty=True)
+        app.add_task(title, description or "")
+
+def handle_update(app: TodoApp) -> None:
+    """Prompt for and update an existing task."""
+    print("\n✏️ UPDATE TASK")
+    app.view_tasks(show_completed=False)  # Show pending tasks for reference
+    task_id = get_user_input("Enter task ID to update: ", int)
+    if task_id:
+        title = get_user_input("Enter new title (press Enter to keep current): ", allow_empty=True)
+        description = get_user_input("Enter new description (press Enter to keep current): ", allow_empty=True)
+        app.update_task(task_id, title, description)
+
+def handle_complete(app: TodoApp) -> None:
+    """Prompt for a task to mark as completed."""
+    print("\n✅ COMPLETE TASK")
+    app.view_tasks(show_completed=False)  # Show pending tasks
+    task_id = get_user_input("Enter task ID to complete: ", int)
+    if task_id:
+        app.complete_task(task_id)
+
+def handle_uncomplete(app: TodoApp) -> None:
+    """Prompt for a completed task to mark as pending."""
+    print("\n🔄 UNCOMPLETE TASK")
+    completed_tasks = app.get_completed_tasks()
+    if completed_tasks:
+        print("\nCompleted Tasks:")
+        for task in completed_tasks:
+            print(f"✅ ID: {task['id']} | {task['title']}")
+        task_id = get_user_input("Enter task ID to mark as pending: ", int)
+        if task_id:
+            app.uncomplete_task(task_id)
+    else:
+        print("📝 No completed tasks found!")
+
+def handle_delete(app: TodoApp) -> None:
+    """Prompt for a task to delete."""
+    print("\n🗑️ DELETE TASK")
+    app.view_tasks()
+    task_id = get_user_input("Enter task ID to delete: ", int)
+    if task_id:
+        app.delete_task(task_id)
+
+def handle_stats(app: TodoApp) -> None:
+    """Display task statistics."""
+    stats = app.get_task_stats()
+    out = [
+        "\n📊 TASK STATISTICS",
+        "="*30,
+        f"📋 Total Tasks: {stats['total']}",
+        f"✅ Completed: {stats['completed']}",
+        f"⏳ Pending: {stats['pending']}",
+    ]
+    if stats['total'] > 0:
+        completion_rate = (stats['completed'] / stats['total']) * 100
+        out.append(f"🎯 Completion Rate: {completion_rate:.1f}%")
+    out.append("="*30)
+    sys.stdout.write("\n".join(out) + "\n")
+
+def handle_exit(app: TodoApp) -> bool:
+    """Say goodbye and signal the main loop to stop."""
+    print("\n👋 Thank you for using To-Do List Manager!")
+    print("💾 All your tasks have been saved automatically.")
+    return True
+
+# Menu choice -> handler; a handler returning True ends the main loop
+HANDLERS: Dict[int, Callable[[TodoApp], Optional[bool]]] = {
+    1: handle_add,
+    2: lambda app: app.view_tasks(show_completed=True),
+    3: lambda app: app.view_tasks(show_completed=False),
+    4: handle_update,
+    5: handle_complete,
+    6: handle_uncomplete,
+    7: handle_delete,
+    8: handle_stats,
+    9: handle_exit,
+}
+
 def main():
     """Main application loop."""
     print("🎯 Welcome to Your Personal To-Do List Manager!")
@@ -248,74 +612,12 @@ def main():
             
             choice = get_user_input("Choose an option (1-9): ", int)
             
-            if choice == 1:  # Add Task
-                print("\n➕ ADD NEW TASK")
-                title = get_user_input("Enter task title: ")
-                if title:
-                    description = get_user_input("Enter task description (optional): ", allow_empty=True)
-                    app.add_task(title, description or "")
-            
-            elif choice == 2:  # View All Tasks
-                app.view_tasks(show_completed=True)
-            
-            elif choice == 3:  # View Pending Tasks
-                app.view_tasks(show_completed=False)
-            
-            elif choice == 4:  # Update Task
-                print("\n✏️ UPDATE TASK")
-                app.view_tasks(show_completed=False)  # Show pending tasks for reference
-                task_id = get_user_input("Enter task ID to update: ", int)
-                if task_id:
-                    title = get_user_input("Enter new title (press Enter to keep current): ", allow_empty=True)
-                    description = get_user_input("Enter new description (press Enter to keep current): ", allow_empty=True)
-                    app.update_task(task_id, title, description)
-            
-            elif choice == 5:  # Complete Task
-                print("\n✅ COMPLETE TASK")
-                app.view_tasks(show_completed=False)  # Show pending tasks
-                task_id = get_user_input("Enter task ID to complete: ", int)
-                if task_id:
-                    app.complete_task(task_id)
-            
-            elif choice == 6:  # Uncomplete Task
-                print("\n🔄 UNCOMPLETE TASK")
-                completed_tasks = [t for t in app.tasks if t['completed']]
-                if completed_tasks:
-                    print("\nCompleted Tasks:")
-                    for task in completed_tasks:
-                        print(f"✅ ID: {task['id']} | {task['title']}")
-                    task_id = get_user_input("Enter task ID to mark as pending: ", int)
-                    if task_id:
-                        app.uncomplete_task(task_id)
-                else:
-                    print("📝 No completed tasks found!")
-            
-            elif choice == 7:  # Delete Task
-                print("\n🗑️ DELETE TASK")
-                app.view_tasks()
-                task_id = get_user_input("Enter task ID to delete: ", int)
-                if task_id:
-                    app.delete_task(task_id)
-            
-            elif choice == 8:  # View Statistics
-                stats = app.get_task_stats()
-                print("\n📊 TASK STATISTICS")
-                print("="*30)
-                print(f"📋 Total Tasks: {stats['total']}")
-                print(f"✅ Completed: {stats['completed']}")
-                print(f"⏳ Pending: {stats['pending']}")
-                if stats['total'] > 0:
-                    completion_rate = (stats['completed'] / stats['total']) * 100
-                    print(f"🎯 Completion Rate: {completion_rate:.1f}%")
-                print("="*30)
-            
-            elif choice == 9:  # Exit
-                print("\n👋 Thank you for using To-Do List Manager!")
-                print("💾 All your tasks have been saved automatically.")
-                break
-            
-            else:
+            handler = HANDLERS.get(choice)
+            if handler is None:
                 print("❌ Invalid option! Please choose a number between 1-9.")
+                continue
+            if handler(app):
+                break
         
         except KeyboardInterrupt:
             print("\n\n👋 Goodbye!")